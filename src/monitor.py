@@ -1,21 +1,79 @@
 #!/usr/bin/env python3
 
 import os
+import atexit
 import sys
-import json
 import time
-import traceback
-from datetime import datetime, timezone, date
-from typing import Any, Dict, Optional, Tuple, List
-
-import requests
-from dotenv import load_dotenv
 import random
-
-def _plural(n: int, one: str, many: str) -> str:
-    return one if n == 1 else many
-
-MESSAGES_MISSED = [
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Tuple
+
+import orjson
+
+if TYPE_CHECKING:
+    import requests
+
+# requests (which drags in urllib3, ssl, idna, charset_normalizer) and dotenv
+# are imported where they are first used, so early-exit runs never load them.
+_SESSION: Optional["requests.Session"] = None
+
+def _backoff(attempt: int) -> float:
+    # Exponential backoff with full jitter: base 1s, capped at 30s.
+    return random.uniform(0, min(1.0 * (2 ** attempt), 30.0))
+
+def _session() -> "requests.Session":
+    # One pooled session for the whole run so the Discord post (and any retry)
+    # reuses connections instead of paying a fresh TCP+TLS handshake per call.
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        max_retries = 3
+
+        class _JitterRetry(Retry):
+            def get_backoff_time(self) -> float:
+                return _backoff(len(self.history) - 1)
+
+            def get_retry_after(self, response):  # type: ignore[override]
+                # Same 30s ceiling as _backoff: an unbounded Retry-After could
+                # outlast the job's timeout-minutes, and then the FATAL log and
+                # secondary alert would never run.
+                value = super().get_retry_after(response)
+                return None if value is None else min(value, 30.0)
+
+            def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):  # type: ignore[override]
+                # super() raises once retries are exhausted, so this only logs
+                # attempts that will actually be retried. Only the host is logged:
+                # a webhook's path is its secret token.
+                new = super().increment(method, url, response, error, _pool, _stacktrace)
+                host = _pool.host if _pool is not None else "?"
+                cause = error.__class__.__name__ if error is not None else f"HTTP {response.status}"
+                log(f"Retrying {method} to {host} after {cause} (retry {len(new.history)} of {max_retries}) …")
+                return new
+
+        # Transient failures (connection errors, 429, 5xx) are retried by urllib3
+        # with jittered exponential backoff; Retry-After (capped at 30s) wins on 429/503.
+        # Other 4xx responses are returned as-is and fail fast. Once retries
+        # run out on a status, the last response is returned (raise_on_status
+        # off) so callers still log its status and body.
+        retry = _JitterRetry(
+            total=max_retries,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        s = requests.Session()
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        atexit.register(s.close)
+        _SESSION = s
+    return _SESSION
+
+MESSAGES_MISSED = (
     "Bro. {d} {_dunit} vanished? You think consistency takes breaks? 😤",
     "You disappeared for {d} {_dunit}? Even your shadow lost faith. 💀",
     "That’s {d} {_dunit} of pure sloth. Legendary downfall, bro. 😮‍💨",
@@ -46,9 +104,9 @@ MESSAGES_MISSED = [
     "Bro vanished for {d} {_dunit}. Tragic, cinematic, unnecessary. 🎬",
     "You fell off harder than stock crypto after {d} {_dunit}. 📉",
     "Bro, {d} {_dunit} silent—are you alive or just lazy? 💀",
-]
+)
 
-MESSAGES_ACTIVE = [
+MESSAGES_ACTIVE = (
     "Still feral. Still flawless. Don’t lose that chaos, bro. 😈🔥",
     "You move like main-character energy every damn day. 💅",
     "The grind fears you. Keep that intimidation streak. 👀",
@@ -79,22 +137,36 @@ MESSAGES_ACTIVE = [
     "You’re what consistency looks like if it had an attitude. {streak}d monster. 😤",
     "That’s {streak} days of showing off and it’s still not enough. 😏",
     "The energy? Unholy. The streak? {streak} days of untouchable. 👹",
-]
+)
+
 
+def _to_printf(template: str, **fields: str) -> str:
+    t = template.replace("%", "%%")
+    for name, value in fields.items():
+        t = t.replace("{" + name + "}", value)
+    return t
 
+# Templates pre-rendered at import into %-format strings, with the day/days
+# unit already baked in, so pick_meme is one choice and one % per call.
+_MISSED_ONE = tuple(_to_printf(m, d="%d", _dunit="day") for m in MESSAGES_MISSED)
+_MISSED_MANY = tuple(_to_printf(m, d="%d", _dunit="days") for m in MESSAGES_MISSED)
+_ACTIVE = tuple(_to_printf(m, streak="%(streak)d") for m in MESSAGES_ACTIVE)
+
+# Private RNG so meme picks don't share state with the module-global one.
+_RNG = random.Random()
 
 def pick_meme(days_missed: int, streak_length_days: int) -> str:
     if days_missed > 0:
-        dunit = _plural(days_missed, "day", "days")
-        msg = random.choice(MESSAGES_MISSED)
-        return msg.format(d=days_missed, _dunit=dunit)
+        return _RNG.choice(_MISSED_ONE if days_missed == 1 else _MISSED_MANY) % days_missed
     else:
-        msg = random.choice(MESSAGES_ACTIVE)
-        return msg.format(streak=streak_length_days)
+        return _RNG.choice(_ACTIVE) % {"streak": streak_length_days}
+
+# A TTY stdout is already line-buffered; only pipes (cron, Actions, journald)
+# need an explicit flush per line to keep log ordering and timestamps honest.
+_FLUSH_LOG = not sys.stdout.isatty()
 
 def log(msg: str) -> None:
-    ts = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-    print(f"[{ts}] {msg}", flush=True)
+    print(f"[{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}] {msg}", flush=_FLUSH_LOG)
 
 def env(name: str, default: Optional[str] = None) -> Optional[str]:
     v = os.getenv(name)
@@ -103,8 +175,10 @@ def env(name: str, default: Optional[str] = None) -> Optional[str]:
 def iso_to_date(d: str) -> date:
     return date.fromisoformat(d)
 
-def today_utc() -> date:
-    return datetime.now(timezone.utc).date()
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def _today_ordinal_utc() -> int:
+    return _EPOCH_ORDINAL + int(time.time()) // 86400
 
 def get_http_timeout() -> int:
     try:
@@ -112,146 +186,305 @@ def get_http_timeout() -> int:
     except Exception:
         return 15
 
-def fetch_with_retry(url: str, timeout: int) -> Any:
-    attempts = 0
-    last_exc = None
-    while attempts < 2:
-        attempts += 1
-        try:
-            log(f"Fetching streak stats (attempt {attempts}) …")
-            r = requests.get(url, timeout=timeout)
-            ok = 200 <= r.status_code < 300
-            log(f"Validation: streak API HTTP {r.status_code}; {'OK' if ok else 'NOT OK'}")
-            if not ok:
-                raise RuntimeError(f"Streak API returned HTTP {r.status_code}: {r.text[:300]}")
-            try:
-                return r.json()
-            except Exception as e:
-                raise RuntimeError(f"Invalid JSON from streak API: {e}") from e
-        except Exception as e:
-            last_exc = e
-            log(f"Error on fetch: {e.__class__.__name__}: {e}")
-            if attempts < 2:
-                log("Retrying in 5 minutes …")
-                time.sleep(300)
-    assert last_exc is not None
-    raise last_exc
-
-def post_discord_with_retry(webhook_url: str, payload: Dict[str, Any], timeout: int) -> None:
-    attempts = 0
-    last_exc = None
-    while attempts < 2:
-        attempts += 1
-        try:
-            sample = {
-                "purpose": "streak_break_warning",
-                "inputs": {
-                    "lastActive": payload.get("content", "")[:200],
-                }
-            }
-            log(f"Preparing Discord notification: {json.dumps(sample)[:240]}")
-
-            r = requests.post(webhook_url, json=payload, timeout=timeout)
-            ok = 200 <= r.status_code < 300
-            log(f"Validation: Discord HTTP {r.status_code}; {'delivered' if ok else 'failed'}")
-            if not ok:
-                raise RuntimeError(f"Discord returned HTTP {r.status_code}: {r.text[:300]}")
-            return
-        except Exception as e:
-            last_exc = e
-            log(f"Error on Discord post: {e.__class__.__name__}: {e}")
-            if attempts < 2:
-                log("Retrying Discord in 5 minutes …")
-                time.sleep(300)
-    assert last_exc is not None
-    raise last_exc
+def get_cache_ttl() -> int:
+    try:
+        return int(env("CACHE_TTL_SECONDS", "600"))
+    except Exception:
+        return 600
+
+class Config(NamedTuple):
+    endpoint: str
+    webhook: Optional[str]
+    secondary_hook: Optional[str]
+    timeout: int
+    always_notify: bool
+    cache_ttl: int
+    cache_fallback: bool
+    cache_path: str
+
+def load_config() -> Config:
+    # Read every setting once, after load_dotenv, instead of on each use.
+    return Config(
+        endpoint=env("STREAK_API_ENDPOINT", "https://api.franznkemaka.com/github-streak/stats/kongesque"),
+        webhook=env("DISCORD_WEBHOOK_URL"),
+        secondary_hook=env("SECONDARY_ERROR_WEBHOOK"),
+        timeout=get_http_timeout(),
+        always_notify=env("ALWAYS_NOTIFY_ACTIVE", "0") == "1",
+        cache_ttl=get_cache_ttl(),
+        cache_fallback=env("CACHE_FALLBACK", "0") == "1",
+        cache_path=os.path.join(
+            env("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+            "streak-monitor",
+            "responses.json",
+        ),
+    )
+
+def _cache_load(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _cache_store(path: str, cache: Dict[str, Any], url: str, entry: Dict[str, Any]) -> None:
+    # `cache` is the dict main() loaded once; update it in place and write it
+    # back rather than re-reading the file.
+    cache[url] = entry
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(cache))
+        os.replace(tmp, path)
+    except OSError as e:
+        log(f"Cache write failed: {e}")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on how much of a response body is ever held in memory.
+_MAX_BODY_BYTES = 1 << 20
+
+def _read_body(r: "requests.Response", limit: int) -> bytes:
+    # Reads a streamed body, stopping once more than `limit` bytes have arrived.
+    buf = bytearray()
+    for chunk in r.iter_content(chunk_size=16384):
+        buf += chunk
+        if len(buf) > limit:
+            break
+    return bytes(buf)
+
+def _error_snippet(r: "requests.Response") -> str:
+    return _read_body(r, 300)[:300].decode("utf-8", "replace")
+
+def _send(method: str, url: str, what: str, timeout: int, **kwargs: Any) -> "requests.Response":
+    # A single send: connection errors, 429 and 5xx are already retried inside
+    # the session's urllib3 Retry, so callers must not loop around this.
+    # Anything else (e.g. a 401 from a bad webhook) comes back on the first
+    # attempt. The streamed response must be closed by the caller.
+    import requests
 
-def normalize_stats(raw: Any) -> Dict[str, Any]:
-    obj = None
-    if isinstance(raw, list) and raw:
-        obj = raw[0]
-    elif isinstance(raw, dict):
-        obj = raw
-    else:
+    try:
+        return _session().request(method, url, timeout=timeout, stream=True, **kwargs)
+    except requests.exceptions.RequestException as e:
+        from urllib.parse import urlsplit
+
+        # urllib3 puts the request path in its messages ("... with url: /api/
+        # webhooks/<id>/<token>"); strip it so neither this line, the FATAL
+        # traceback nor the secondary alert leaks a webhook token.
+        path = urlsplit(url).path
+        msg = str(e).replace(path, "/…") if len(path) > 1 else str(e)
+        log(f"Error on {what}: {e.__class__.__name__}: {msg}")
+        raise type(e)(msg) from None
+
+# Shape contract for the streak API object, checked by normalize_stats.
+_STATS_KEYS = ("totalContributions", "firstContribution", "longestStreak", "currentStreak")
+_STREAK_KEYS = ("start", "end", "days")
+
+def _trim_stats(raw: Any) -> Any:
+    # Keep only the fields normalize_stats reads, so any extra data the API
+    # returns is dropped right after decoding and never written to the cache.
+    obj = raw[0] if isinstance(raw, list) and raw else raw
+    if not isinstance(obj, dict):
+        return raw
+    return {k: obj[k] for k in _STATS_KEYS if k in obj}
+
+def _cache_get(cache: Dict[str, Any], url: str) -> Optional[Dict[str, Any]]:
+    entry = cache.get(url)
+    if not isinstance(entry, dict) or "body" not in entry:
+        return None
+    return entry
+
+def _cache_age(entry: Dict[str, Any]) -> float:
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(fetched_at, (int, float)):
+        return float("inf")
+    return time.time() - fetched_at
+
+def _fetch_streak(cfg: Config, cache: Dict[str, Any], cached: Optional[Dict[str, Any]]) -> Any:
+    url = cfg.endpoint
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    log("Fetching streak stats …")
+    with _send("GET", url, "fetch", cfg.timeout, headers=headers) as r:
+        if r.status_code == 304 and cached is not None:
+            log("Validation: streak API HTTP 304; using cached response")
+            _cache_store(cfg.cache_path, cache, url, {**cached, "fetched_at": time.time()})
+            return cached["body"]
+        ok = 200 <= r.status_code < 300
+        log(f"Validation: streak API HTTP {r.status_code}; {'OK' if ok else 'NOT OK'}")
+        if not ok:
+            raise RuntimeError(f"Streak API returned HTTP {r.status_code}: {_error_snippet(r)}")
+        body = _read_body(r, _MAX_BODY_BYTES)
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+
+    if len(body) > _MAX_BODY_BYTES:
+        raise RuntimeError(f"Streak API response exceeds {_MAX_BODY_BYTES} bytes")
+    try:
+        data = _trim_stats(orjson.loads(body))
+    except Exception as e:
+        raise RuntimeError(f"Invalid JSON from streak API: {e}") from e
+
+    _cache_store(cfg.cache_path, cache, url, {"fetched_at": time.time(), "etag": etag, "last_modified": last_modified, "body": data})
+    return data
+
+def fetch_with_retry(cfg: Config, cache: Dict[str, Any], cached: Optional[Dict[str, Any]], today: str) -> Tuple[Any, Optional[str]]:
+    # Returns (stats, stale); stale is None for live or TTL-fresh data, or a
+    # description of the failure when CACHE_FALLBACK served an old entry.
+    # A TTL hit is only served when it shows activity today: cached data can
+    # predate today's contributions, so it must never produce a warning.
+    if cached is not None and _cached_streak_end(cached) == today:
+        age = _cache_age(cached)
+        if age < cfg.cache_ttl:
+            log(f"Using cached streak stats ({int(age)}s old, CACHE_TTL_SECONDS={cfg.cache_ttl})")
+            return cached["body"], None
+
+    try:
+        return _fetch_streak(cfg, cache, cached), None
+    except Exception as e:
+        if cached is None or not cfg.cache_fallback:
+            raise
+        stale = f"fetch failed ({e.__class__.__name__}: {e}); using cached response ({int(_cache_age(cached))}s old)"
+        log(f"CACHE_FALLBACK: {stale}")
+        return cached["body"], stale
+
+def post_discord_with_retry(webhook_url: str, body: bytes, timeout: int) -> None:
+    log(f"Preparing Discord notification: len={len(body)} bytes")
+
+    with _send("POST", webhook_url, "Discord post", timeout, data=body, headers=_JSON_HEADERS) as r:
+        ok = 200 <= r.status_code < 300
+        log(f"Validation: Discord HTTP {r.status_code}; {'delivered' if ok else 'failed'}")
+        if not ok:
+            raise RuntimeError(f"Discord returned HTTP {r.status_code}: {_error_snippet(r)}")
+
+_MISSING = object()
+
+def _validate_stats(raw: Any) -> Dict[str, Any]:
+    # Exact type checks: the decoded API payload only ever contains plain
+    # lists and dicts, never subclasses.
+    obj = raw[0] if type(raw) is list and raw else raw
+    if type(obj) is not dict:
         raise ValueError("Unexpected API response shape; expected list with one object or a single object.")
 
-    required_top = ["totalContributions", "firstContribution", "longestStreak", "currentStreak"]
-    for k in required_top:
-        if k not in obj:
-            raise ValueError(f"Missing key: {k}")
+    g = obj.get
+    top = (g("totalContributions", _MISSING), g("firstContribution", _MISSING),
+           g("longestStreak", _MISSING), g("currentStreak", _MISSING))
+    if _MISSING in top:
+        raise ValueError(f"Missing key: {_STATS_KEYS[top.index(_MISSING)]}")
 
-    cs = obj["currentStreak"]
-    ls = obj["longestStreak"]
-    for streak_key, thing in [("currentStreak", cs), ("longestStreak", ls)]:
-        if not isinstance(thing, dict):
+    for streak_key, thing in (("currentStreak", top[3]), ("longestStreak", top[2])):
+        if type(thing) is not dict:
             raise ValueError(f"{streak_key} must be an object")
-        for sub in ["start", "end", "days"]:
-            if sub not in thing:
-                raise ValueError(f"Missing key: {streak_key}.{sub}")
+        if not ("start" in thing and "end" in thing and "days" in thing):
+            sub = next(k for k in _STREAK_KEYS if k not in thing)
+            raise ValueError(f"Missing key: {streak_key}.{sub}")
+    return obj
 
+def normalize_stats(raw: Any) -> Dict[str, Any]:
+    obj = _validate_stats(raw)
     log(f"Validation: parsed fields: total={obj['totalContributions']}, currentStreak.days={obj['currentStreak']['days']}")
     return obj
 
-def compute_days_missed(last_active_str: str) -> Tuple[int, date]:
+def _cached_streak_end(cached: Optional[Dict[str, Any]]) -> Optional[str]:
+    # The streak end date never moves backwards, so a cached end of today is
+    # enough to know the streak is active without asking the API again.
+    if cached is None:
+        return None
+    try:
+        return _validate_stats(cached["body"])["currentStreak"]["end"]
+    except ValueError:
+        return None
+
+def compute_days_missed(last_active_str: str, today_ord: int) -> Tuple[int, date]:
     last_active_dt = iso_to_date(last_active_str)
-    today = today_utc()
-    delta_days = (today - last_active_dt).days
+    delta_days = today_ord - last_active_dt.toordinal()
     return (max(0, delta_days), last_active_dt)
 
-def notify_secondary(message: str, timeout: int) -> None:
-    hook = env("SECONDARY_ERROR_WEBHOOK")
+def notify_secondary(hook: Optional[str], message: str, timeout: int) -> None:
     if not hook:
         return
+    import requests
+
+    # Best effort: this runs on the failure path, so it must never raise.
+    body = orjson.dumps({"content": message})
     try:
-        requests.post(hook, json={"content": message}, timeout=timeout)
+        with _send("POST", hook, "secondary notification", timeout, data=body, headers=_JSON_HEADERS) as r:
+            if not 200 <= r.status_code < 300:
+                log(f"Secondary notification failed: HTTP {r.status_code}: {_error_snippet(r)}")
+    except requests.exceptions.RequestException:
+        pass  # already logged by _send
     except Exception as e:
         log(f"Secondary notification failed: {e}")
 
-def build_discord_message(last_active: date, streak_length_days: int, days_missed: int, is_warning: bool) -> str:
-    line1 = pick_meme(days_missed, streak_length_days)
-    return f"{line1}\n"
+def build_discord_message(last_active_iso: str, streak_length_days: int, days_missed: int, is_warning: bool) -> str:
+    return "%s\n" % pick_meme(days_missed, streak_length_days)
+
+# Same lookup order as find_dotenv (src/, then the repo root) without walking
+# every parent directory, so deployments that inject env vars never import dotenv.
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+_ENV_FILES = (os.path.join(_SRC_DIR, ".env"), os.path.join(os.path.dirname(_SRC_DIR), ".env"))
 
 def main() -> int:
-    load_dotenv(override=False)
+    env_file = next((p for p in _ENV_FILES if os.path.isfile(p)), None)
+    if env_file is not None:
+        from dotenv import load_dotenv
 
-    endpoint = env("STREAK_API_ENDPOINT", "https://api.franznkemaka.com/github-streak/stats/kongesque")
-    webhook = env("DISCORD_WEBHOOK_URL")
-    timeout = get_http_timeout()
+        load_dotenv(env_file, override=False)
+    cfg = load_config()
 
-    if not webhook:
+    if not cfg.webhook:
         log("FATAL: DISCORD_WEBHOOK_URL not set")
-        notify_secondary("Streak monitor: DISCORD_WEBHOOK_URL missing.", timeout)
+        notify_secondary(cfg.secondary_hook, "Streak monitor: DISCORD_WEBHOOK_URL missing.", cfg.timeout)
         return 2
 
     try:
-        raw = fetch_with_retry(endpoint, timeout)
+        today_ord = _today_ordinal_utc()
+        today = date.fromordinal(today_ord)
+        cache = _cache_load(cfg.cache_path)
+        cached = _cache_get(cache, cfg.endpoint)
+        if not cfg.always_notify and _cached_streak_end(cached) == today.isoformat():
+            log("No action: cached stats already show activity today (daysMissed=0); skipping fetch.")
+            return 0
+
+        raw, stale = fetch_with_retry(cfg, cache, cached, today.isoformat())
+        if stale is not None:
+            notify_secondary(cfg.secondary_hook, f"Streak monitor degraded: {stale}", cfg.timeout)
         stats = normalize_stats(raw)
 
         last_active_str = stats["currentStreak"]["end"]
         streak_len_days = int(stats["currentStreak"]["days"])
-        days_missed, last_active = compute_days_missed(last_active_str)
-
-        log(f"Computed daysMissed={days_missed} from today={today_utc().isoformat()} and lastActive={last_active.isoformat()}.")
-
-        if days_missed > 0:
-            content = build_discord_message(last_active, streak_len_days, days_missed, is_warning=True)
-            payload = {"content": content}
-            post_discord_with_retry(webhook, payload, timeout)
-        else:
-            always_notify = env("ALWAYS_NOTIFY_ACTIVE", "0") == "1"
-            if always_notify:
-                content = build_discord_message(last_active, streak_len_days, days_missed, is_warning=False)
-                payload = {"content": content}
-                post_discord_with_retry(webhook, payload, timeout)
-            else:
-                log("No action: streak is active (daysMissed=0). Set ALWAYS_NOTIFY_ACTIVE=1 to send hype messages daily.")
+        days_missed, last_active = compute_days_missed(last_active_str, today_ord)
+
+        log(f"Computed daysMissed={days_missed} from today={today} and lastActive={last_active}.")
+
+        is_warning = days_missed > 0
+        if not is_warning and not cfg.always_notify:
+            log("No action: streak is active (daysMissed=0). Set ALWAYS_NOTIFY_ACTIVE=1 to send hype messages daily.")
+            return 0
+        if is_warning and stale is not None:
+            # Cached data can predate today's activity, so a warning built
+            # from it may be wrong; the outage was reported above instead.
+            log("No action: not sending a streak warning based on stale cached stats.")
+            return 0
+
+        content = build_discord_message(last_active_str, streak_len_days, days_missed, is_warning=is_warning)
+        post_discord_with_retry(cfg.webhook, orjson.dumps({"content": content}), cfg.timeout)
 
         return 0
 
     except Exception as e:
         log("FATAL: job failed after retry.")
-        log("Traceback:\n" + "".join(traceback.format_exception(e)))
-        notify_secondary(f"Streak monitor failed: {e}", timeout)
+        import traceback
+
+        traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+        sys.stderr.flush()
+        notify_secondary(cfg.secondary_hook, f"Streak monitor failed: {e}", cfg.timeout)
         return 1
 
 if __name__ == "__main__":